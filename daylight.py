@@ -5,49 +5,229 @@ daylight - A CLI tool to get sunlight hours for a given date and location.
 
 import argparse
 import datetime
+import functools
 import json
+import math
+import os
 import sys
-import pytz
+import time
+from pathlib import Path
 from typing import Dict, Any, Tuple, Optional
 from zoneinfo import ZoneInfo
-from timezonefinder import TimezoneFinder
 
-import requests
-from astral import LocationInfo
-from astral.sun import sun
+try:
+    import orjson  # optional C serializer; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+# requests, timezonefinder, and astral are imported lazily inside the
+# functions that need them: timezonefinder in particular loads a large
+# polygon dataset, and none of them are needed for --help or argument
+# errors, so deferring them cuts cold start substantially.
+
+
+@functools.lru_cache(maxsize=1)
+def _session():
+    """
+    Build the shared HTTP session on first use. Reuses the TCP+TLS
+    connection across calls within one invocation, retries transient
+    failures with backoff, and carries the User-Agent that Nominatim's
+    usage policy requires.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": "daylight-cli/1.0"})
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503]),
+        ),
+    )
+    return session
+
+_tf_future = None
+
+
+def _prefetch_tf() -> None:
+    """
+    Start loading the TimezoneFinder index on a worker thread, so it can
+    overlap with the geocoding HTTP request instead of running after it.
+    _tf() picks up the result; calling this is never required.
+    """
+    global _tf_future
+    if _tf_future is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _tf_future = ThreadPoolExecutor(max_workers=1).submit(_build_tf)
+
+
+def _build_tf():
+    from timezonefinder import TimezoneFinder
+    return TimezoneFinder()
+
+
+@functools.lru_cache(maxsize=1)
+def _tf():
+    """
+    Return the shared TimezoneFinder, waiting on the prefetch if one is
+    in flight. It loads a sizable polygon index, so every caller shares
+    a single instance.
+    """
+    if _tf_future is not None:
+        return _tf_future.result()
+    return _build_tf()
+
+
+def _tz_for(latitude: float, longitude: float) -> str:
+    """
+    Resolve the timezone name for a coordinate pair, defaulting to UTC
+    when the point falls outside every known timezone polygon.
+    """
+    return _tf().timezone_at(lat=latitude, lng=longitude) or "UTC"
+
+
+# On-disk cache for geocoding lookups, so repeat queries skip the network
+# entirely (and stay well under Nominatim's 1 request/second policy).
+_CACHE_PATH = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "daylight" / "geocache.json"
+_cache: Optional[Dict[str, Any]] = None
+
+
+def _load_cache() -> Dict[str, Any]:
+    """
+    Load the geocoding cache from disk, lazily, on first use.
+    """
+    global _cache
+    if _cache is None:
+        try:
+            with open(_CACHE_PATH) as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = {}
+        if not isinstance(_cache, dict):
+            _cache = {}
+    return _cache
+
+
+def _save_cache(cache: Dict[str, Any]) -> None:
+    """
+    Write the geocoding cache back to disk atomically. Best-effort:
+    a read-only cache directory should never break a lookup.
+    """
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CACHE_PATH.with_suffix(".json.tmp")
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(cache))
+        else:
+            with open(tmp_path, "w") as f:
+                json.dump(cache, f, separators=(",", ":"))
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        pass
+
+
+_NOMINATIM_STAMP = _CACHE_PATH.parent / "last_nominatim"
+
+
+def _pace_nominatim() -> None:
+    """
+    Sleep as needed so consecutive Nominatim requests — including ones
+    from separate CLI invocations — stay at most one per second, per the
+    service's usage policy. A 429 penalty costs far more than the pause.
+    The timestamp lives next to the geocode cache, so cache hits never
+    get here and pay nothing; pacing itself is best-effort.
+    """
+    now = time.time()
+    try:
+        last = float(_NOMINATIM_STAMP.read_text())
+    except (OSError, ValueError):
+        last = 0.0
+    wait = 1.0 - (now - last)
+    if 0.0 < wait <= 1.0:
+        time.sleep(wait)
+    try:
+        _NOMINATIM_STAMP.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _NOMINATIM_STAMP.with_suffix(".tmp")
+        tmp_path.write_text(str(time.time()))
+        os.replace(tmp_path, _NOMINATIM_STAMP)
+    except OSError:
+        pass
+
+
+def _cached(prefix: str, ttl: float):
+    """
+    Decorator caching a location lookup on disk.
+    Keys are the prefix plus the normalized string arguments; entries
+    older than ttl seconds are refreshed from the network.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = ":".join([prefix] + [str(a).strip().lower() for a in args])
+            cache = _load_cache()
+            entry = cache.get(key)
+            try:
+                if time.time() - entry["ts"] < ttl:
+                    name, latitude, longitude, timezone_str = entry["value"]
+                    return name, latitude, longitude, timezone_str
+            except (TypeError, KeyError, ValueError):
+                pass  # absent or malformed entry: treat as a miss
+            # Cache miss: a network lookup is coming, so start loading
+            # the timezone index now to overlap with the HTTP round-trip
+            _prefetch_tf()
+            value = func(*args)
+            cache[key] = {"ts": time.time(), "value": list(value)}
+            _save_cache(cache)
+            return value
+        return wrapper
+    return decorator
+
+
+@_cached("ip", ttl=3600)  # IPs move; keep this one short
+def _ip_lookup() -> Tuple[str, float, float, str]:
+    """
+    Resolve the user's location from their IP address, raising on any
+    failure so that only successful lookups reach the cache.
+    Returns a tuple of (location_name, latitude, longitude, timezone)
+    """
+    response = _session().get("https://ipinfo.io/json", timeout=5)
+    data = response.json()
+
+    # Extract location information
+    location = data.get("city", "Unknown")
+    if "region" in data and data["region"]:
+        location += f", {data['region']}"
+    elif "country" in data:
+        location += f", {data['country']}"
+
+    # Extract coordinates
+    if "loc" in data and data["loc"]:
+        lat_lng = data["loc"].split(",")
+        latitude = float(lat_lng[0])
+        longitude = float(lat_lng[1])
+
+        # Get timezone from coordinates
+        timezone_str = _tz_for(latitude, longitude)
+
+        return location, latitude, longitude, timezone_str
+
+    raise ValueError("Could not determine location from IP")
 
 
 def get_location_from_ip() -> Tuple[str, float, float, str]:
     """
-    Get the user's location based on their IP address.
+    Get the user's location based on their IP address, falling back to
+    a default on failure. The fallback stays outside the cached lookup
+    so a transient error is never persisted and replayed.
     Returns a tuple of (location_name, latitude, longitude, timezone)
     """
     try:
-        response = requests.get("https://ipinfo.io/json", timeout=5)
-        data = response.json()
-        
-        # Extract location information
-        location = data.get("city", "Unknown")
-        if "region" in data and data["region"]:
-            location += f", {data['region']}"
-        elif "country" in data:
-            location += f", {data['country']}"
-            
-        # Extract coordinates
-        if "loc" in data and data["loc"]:
-            lat_lng = data["loc"].split(",")
-            latitude = float(lat_lng[0])
-            longitude = float(lat_lng[1])
-            
-            # Get timezone from coordinates
-            tf = TimezoneFinder()
-            timezone_str = tf.timezone_at(lat=latitude, lng=longitude)
-            if not timezone_str:
-                timezone_str = "UTC"
-                
-            return location, latitude, longitude, timezone_str
-        
-        raise ValueError("Could not determine location from IP")
+        return _ip_lookup()
     except Exception as e:
         print(f"Error determining location from IP: {e}", file=sys.stderr)
         print("Using default location: Mountain View, CA", file=sys.stderr)
@@ -55,15 +235,17 @@ def get_location_from_ip() -> Tuple[str, float, float, str]:
         return "Mountain View, CA", 37.3861, -122.0839, "America/Los_Angeles"
 
 
+@_cached("zip", ttl=30 * 86400)
 def get_location_from_zipcode(zipcode: str) -> Tuple[str, float, float, str]:
     """
     Get location information from a ZIP/postal code.
     Returns a tuple of (location_name, latitude, longitude, timezone)
     """
     try:
-        response = requests.get(
-            f"https://nominatim.openstreetmap.org/search?postalcode={zipcode}&format=json&limit=1",
-            headers={"User-Agent": "daylight-cli/1.0"},
+        _pace_nominatim()
+        response = _session().get(
+            "https://nominatim.openstreetmap.org/search",
+            params={"postalcode": zipcode, "format": "json", "limit": 1},
             timeout=5
         )
         data = response.json()
@@ -78,26 +260,25 @@ def get_location_from_zipcode(zipcode: str) -> Tuple[str, float, float, str]:
         longitude = float(result["lon"])
         
         # Get timezone from coordinates
-        tf = TimezoneFinder()
-        timezone_str = tf.timezone_at(lat=latitude, lng=longitude)
-        if not timezone_str:
-            timezone_str = "UTC"
-            
+        timezone_str = _tz_for(latitude, longitude)
+
         return location_name, latitude, longitude, timezone_str
     except Exception as e:
         print(f"Error finding location for ZIP code {zipcode}: {e}", file=sys.stderr)
         raise
 
 
+@_cached("name", ttl=30 * 86400)
 def get_location_from_name(location_name: str) -> Tuple[str, float, float, str]:
     """
     Convert a location name to coordinates.
     Returns a tuple of (formatted_location_name, latitude, longitude, timezone)
     """
     try:
-        response = requests.get(
-            f"https://nominatim.openstreetmap.org/search?q={location_name}&format=json&limit=1",
-            headers={"User-Agent": "daylight-cli/1.0"},
+        _pace_nominatim()
+        response = _session().get(
+            "https://nominatim.openstreetmap.org/search",
+            params={"q": location_name, "format": "json", "limit": 1},
             timeout=5
         )
         data = response.json()
@@ -116,24 +297,24 @@ def get_location_from_name(location_name: str) -> Tuple[str, float, float, str]:
         longitude = float(result["lon"])
         
         # Get timezone from coordinates
-        tf = TimezoneFinder()
-        timezone_str = tf.timezone_at(lat=latitude, lng=longitude)
-        if not timezone_str:
-            timezone_str = "UTC"
-            
+        timezone_str = _tz_for(latitude, longitude)
+
         return formatted_name, latitude, longitude, timezone_str
     except Exception as e:
         print(f"Error finding location {location_name}: {e}", file=sys.stderr)
         raise
 
 
-def get_date_from_string(date_str: Optional[str] = None) -> datetime.date:
+def get_date_from_string(date_str: Optional[str] = None,
+                         today: Optional[datetime.date] = None) -> datetime.date:
     """
     Parse a date string into a datetime.date object.
     Handles special keywords like 'tomorrow', 'yesterday', 'day-after'.
-    If date_str is None, returns today's date.
+    If date_str is None, returns today's date. Callers that already know
+    today's date can pass it in to avoid re-resolving it.
     """
-    today = datetime.date.today()
+    if today is None:
+        today = datetime.date.today()
     
     if not date_str:
         return today
@@ -150,8 +331,9 @@ def get_date_from_string(date_str: Optional[str] = None) -> datetime.date:
         return today + datetime.timedelta(days=2)
     else:
         try:
-            # Try to parse as YYYY-MM-DD
-            return datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+            # Try to parse as YYYY-MM-DD; fromisoformat is a dedicated
+            # C fast path, much quicker than strptime's format machinery
+            return datetime.date.fromisoformat(date_str)
         except ValueError:
             raise ValueError(
                 f"Invalid date format: {date_str}. "
@@ -159,30 +341,124 @@ def get_date_from_string(date_str: Optional[str] = None) -> datetime.date:
             )
 
 
+# Days from the proleptic-Gregorian ordinal to the Julian day at 00:00 UTC
+_JD_MIDNIGHT_OFFSET = 1721424.5
+
+
+def _solar_params(jc: float) -> Tuple[float, float]:
+    """
+    NOAA equation of time (minutes) and solar declination (radians) at
+    the given Julian century. These are the NOAA solar-calculator
+    formulas, accurate to seconds over centuries — unlike the simpler
+    day-of-year Fourier fit, which drifts by several minutes at high
+    latitudes.
+    """
+    gml = math.radians((280.46646 + jc * (36000.76983 + jc * 0.0003032)) % 360.0)
+    gma = math.radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+    ecc = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+    eq_of_center = (math.sin(gma) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+                    + math.sin(2 * gma) * (0.019993 - 0.000101 * jc)
+                    + math.sin(3 * gma) * 0.000289)
+    omega = math.radians(125.04 - 1934.136 * jc)
+    app_long = math.radians(math.degrees(gml) + eq_of_center
+                            - 0.00569 - 0.00478 * math.sin(omega))
+    mean_obliq = 23.0 + (26.0 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60.0) / 60.0
+    obliq = math.radians(mean_obliq + 0.00256 * math.cos(omega))
+    decl = math.asin(math.sin(obliq) * math.sin(app_long))
+    var_y = math.tan(obliq / 2.0) ** 2
+    eqtime = 4.0 * math.degrees(
+        var_y * math.sin(2 * gml) - 2.0 * ecc * math.sin(gma)
+        + 4.0 * ecc * var_y * math.sin(gma) * math.cos(2 * gml)
+        - 0.5 * var_y * var_y * math.sin(4 * gml)
+        - 1.25 * ecc * ecc * math.sin(2 * gma))
+    return eqtime, decl
+
+
+def _noaa_event_minutes(jd_midnight: float, latitude: float, longitude: float,
+                        minutes_guess: float, rising: bool) -> float:
+    """
+    Minutes after 00:00 UTC of sunrise (rising=True) or sunset for the
+    day starting at jd_midnight, evaluating the solar terms at the
+    guessed event time. The cosine of the hour angle is clipped into
+    [-1, 1] so polar night collapses to zero daylight and midnight sun
+    to a full 24 hours instead of a domain error.
+    """
+    jc = (jd_midnight + minutes_guess / 1440.0 - 2451545.0) / 36525.0
+    eqtime, decl = _solar_params(jc)
+    lat_rad = math.radians(latitude)
+    # Hour angle at a zenith of 90.833 degrees (refraction + solar radius)
+    cos_ha = (math.cos(math.radians(90.833)) / (math.cos(lat_rad) * math.cos(decl))
+              - math.tan(lat_rad) * math.tan(decl))
+    ha = math.degrees(math.acos(max(-1.0, min(1.0, cos_ha))))
+    if rising:
+        return 720.0 - 4.0 * (longitude + ha) - eqtime
+    return 720.0 - 4.0 * (longitude - ha) - eqtime
+
+
+def _sunrise_sunset_noaa(date: datetime.date,
+                         latitude: float,
+                         longitude: float,
+                         timezone_str: str) -> Tuple[datetime.datetime, datetime.datetime]:
+    """
+    Closed-form NOAA sunrise/sunset for a single date. Pure arithmetic,
+    no astral needed: one solve at solar noon plus one refinement at the
+    first-pass event time. Agrees with astral to within about a minute —
+    the same order as atmospheric refraction variability. Polar night
+    and midnight sun clamp to zero and full-day daylight instead of
+    raising.
+    """
+    jd_midnight = date.toordinal() + _JD_MIDNIGHT_OFFSET
+    sunrise_utc = _noaa_event_minutes(jd_midnight, latitude, longitude, 720.0, True)
+    sunrise_utc = _noaa_event_minutes(jd_midnight, latitude, longitude, sunrise_utc, True)
+    sunset_utc = _noaa_event_minutes(jd_midnight, latitude, longitude, 720.0, False)
+    sunset_utc = _noaa_event_minutes(jd_midnight, latitude, longitude, sunset_utc, False)
+
+    # Minutes after 00:00 UTC, converted to the local timezone
+    midnight_utc = datetime.datetime(date.year, date.month, date.day,
+                                     tzinfo=datetime.timezone.utc)
+    tzinfo = ZoneInfo(timezone_str)
+    sunrise = (midnight_utc + datetime.timedelta(minutes=sunrise_utc)).astimezone(tzinfo)
+    sunset = (midnight_utc + datetime.timedelta(minutes=sunset_utc)).astimezone(tzinfo)
+    return sunrise, sunset
+
+
+def _dumps_indented(data: Dict[str, Any]) -> str:
+    """
+    Serialize a result dict as indented JSON, via orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
 def get_sunlight_data(date: datetime.date, 
                       latitude: float, 
                       longitude: float, 
                       timezone_str: str, 
-                      location_name: str = "Custom Location") -> Dict[str, Any]:
+                      location_name: str = "Custom Location",
+                      need_astronomical: bool = True) -> Dict[str, Any]:
     """
     Calculate sunlight information for the given date and coordinates.
     Returns a dictionary with sunlight information.
+    When need_astronomical is False, only sunrise and sunset are computed
+    (skipping the dawn/noon/dusk solves) and the "astronomical" section
+    is omitted from the result.
     """
-    # Create a location object with the given coordinates
-    location = LocationInfo(
-        name=location_name,
-        region="",
-        timezone=timezone_str,
-        latitude=latitude,
-        longitude=longitude
-    )
-    
     # Get sun information for the specified date
-    s = sun(location.observer, date=date, tzinfo=ZoneInfo(timezone_str))
-    
-    # Calculate sunlight duration in hours
-    sunrise = s["sunrise"]
-    sunset = s["sunset"]
+    if need_astronomical:
+        from astral import Observer
+        import astral.sun
+
+        # All astral needs is the observer coordinates; LocationInfo's
+        # name/region/timezone plumbing was only feeding the result dict
+        observer = Observer(latitude=latitude, longitude=longitude)
+        s = astral.sun.sun(observer, date=date, tzinfo=ZoneInfo(timezone_str))
+        sunrise = s["sunrise"]
+        sunset = s["sunset"]
+    else:
+        # Default/brief output needs only sunrise and sunset; the NOAA
+        # closed form avoids importing astral at all on this path
+        sunrise, sunset = _sunrise_sunset_noaa(date, latitude, longitude, timezone_str)
     
     # Calculate duration in hours and minutes
     duration = sunset - sunrise
@@ -196,7 +472,7 @@ def get_sunlight_data(date: datetime.date,
     result = {
         "date": date.isoformat(),
         "location": {
-            "name": location.name,
+            "name": location_name,
             "latitude": latitude,
             "longitude": longitude,
             "timezone": timezone_str
@@ -208,21 +484,204 @@ def get_sunlight_data(date: datetime.date,
             "sunset_time": sunset_str,
             "duration_hours": round(hours, 2),
         },
-        "astronomical": {
+    }
+
+    if need_astronomical:
+        result["astronomical"] = {
             "dawn": s["dawn"].isoformat(),
             "dusk": s["dusk"].isoformat(),
             "noon": s["noon"].isoformat(),
         }
-    }
-    
+
     return result
 
 
-def format_output(data: Dict[str, Any], output_format: str) -> str:
+def _noaa_minutes_numpy(jd_midnight, latitude: float, longitude: float):
+    """
+    Vectorized NOAA sunrise/sunset kernel: minutes after 00:00 UTC for
+    each Julian-day-at-midnight in the input array. Same equations and
+    refinement pass as the scalar _sunrise_sunset_noaa, broadcast over
+    NumPy arrays.
+    """
+    import numpy as np
+
+    lat_rad = np.radians(latitude)
+    cos_zenith = np.cos(np.radians(90.833))
+
+    def solve(minutes_guess, sign):
+        jc = (jd_midnight + minutes_guess / 1440.0 - 2451545.0) / 36525.0
+        gml = np.radians((280.46646 + jc * (36000.76983 + jc * 0.0003032)) % 360.0)
+        gma = np.radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+        ecc = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+        eq_of_center = (np.sin(gma) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+                        + np.sin(2 * gma) * (0.019993 - 0.000101 * jc)
+                        + np.sin(3 * gma) * 0.000289)
+        omega = np.radians(125.04 - 1934.136 * jc)
+        app_long = np.radians(np.degrees(gml) + eq_of_center
+                              - 0.00569 - 0.00478 * np.sin(omega))
+        mean_obliq = 23.0 + (26.0 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60.0) / 60.0
+        obliq = np.radians(mean_obliq + 0.00256 * np.cos(omega))
+        decl = np.arcsin(np.sin(obliq) * np.sin(app_long))
+        var_y = np.tan(obliq / 2.0) ** 2
+        eqtime = 4.0 * np.degrees(
+            var_y * np.sin(2 * gml) - 2.0 * ecc * np.sin(gma)
+            + 4.0 * ecc * var_y * np.sin(gma) * np.cos(2 * gml)
+            - 0.5 * var_y * var_y * np.sin(4 * gml)
+            - 1.25 * ecc * ecc * np.sin(2 * gma))
+        # Clip so polar night/midnight sun clamp instead of raising
+        cos_ha = (cos_zenith / (np.cos(lat_rad) * np.cos(decl))
+                  - np.tan(lat_rad) * np.tan(decl))
+        ha = np.degrees(np.arccos(np.clip(cos_ha, -1.0, 1.0)))
+        return 720.0 - 4.0 * (longitude + sign * ha) - eqtime
+
+    noon_guess = np.full(jd_midnight.shape, 720.0)
+    sunrise_utc = solve(solve(noon_guess, 1.0), 1.0)
+    sunset_utc = solve(solve(noon_guess, -1.0), -1.0)
+    return sunrise_utc, sunset_utc
+
+
+@functools.lru_cache(maxsize=1)
+def _noaa_minutes_kernel():
+    """
+    Pick the range-mode kernel once per process: a Numba-fused parallel
+    loop when numba is installed (no temporary arrays, SIMD-friendly),
+    otherwise the vectorized NumPy implementation.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return _noaa_minutes_numpy
+
+    import numpy as np
+
+    solar_params = njit(cache=True)(_solar_params)
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def kernel(jd_midnight, latitude, longitude):
+        n = jd_midnight.size
+        sunrise_utc = np.empty(n, dtype=np.float64)
+        sunset_utc = np.empty(n, dtype=np.float64)
+        lat_rad = math.radians(latitude)
+        cos_zenith = math.cos(math.radians(90.833))
+        for i in prange(n):
+            rise = 720.0
+            setting = 720.0
+            # One solve at solar noon, one refinement at the event time
+            for _ in range(2):
+                jc = (jd_midnight[i] + rise / 1440.0 - 2451545.0) / 36525.0
+                eqtime, decl = solar_params(jc)
+                cos_ha = (cos_zenith / (math.cos(lat_rad) * math.cos(decl))
+                          - math.tan(lat_rad) * math.tan(decl))
+                ha = math.degrees(math.acos(min(1.0, max(-1.0, cos_ha))))
+                rise = 720.0 - 4.0 * (longitude + ha) - eqtime
+                jc = (jd_midnight[i] + setting / 1440.0 - 2451545.0) / 36525.0
+                eqtime, decl = solar_params(jc)
+                cos_ha = (cos_zenith / (math.cos(lat_rad) * math.cos(decl))
+                          - math.tan(lat_rad) * math.tan(decl))
+                ha = math.degrees(math.acos(min(1.0, max(-1.0, cos_ha))))
+                setting = 720.0 - 4.0 * (longitude - ha) - eqtime
+            sunrise_utc[i] = rise
+            sunset_utc[i] = setting
+        return sunrise_utc, sunset_utc
+
+    return kernel
+
+
+def get_sunlight_data_range(start_date: datetime.date,
+                            end_date: datetime.date,
+                            latitude: float,
+                            longitude: float,
+                            timezone_str: str,
+                            location_name: str = "Custom Location") -> Dict[str, Any]:
+    """
+    Calculate sunrise/sunset for every date from start_date to end_date
+    (inclusive) in one vectorized pass.
+    Uses the NOAA closed-form solar position equations over NumPy arrays,
+    so the per-date cost is a handful of array operations rather than a
+    full astral solve per day. Accuracy is within about a minute, which
+    is the same order as atmospheric refraction variability.
+    Returns a dictionary with the location and one row per day.
+    """
+    import numpy as np
+
+    if end_date < start_date:
+        raise ValueError("Range end date must not be before the start date")
+
+    dates = np.arange(start_date, end_date + datetime.timedelta(days=1),
+                      dtype="datetime64[D]")
+
+    # Minutes after 00:00 UTC for each date, via the fastest available
+    # kernel. Unix day 0 began at Julian day 2440587.5.
+    jd_midnight = dates.astype(np.int64) + 2440587.5
+    sunrise_utc, sunset_utc = _noaa_minutes_kernel()(jd_midnight, latitude, longitude)
+
+    tzinfo = ZoneInfo(timezone_str)
+    utc = datetime.timezone.utc
+    days = []
+    for date64, rise_min, set_min in zip(dates, sunrise_utc, sunset_utc):
+        date = date64.astype(datetime.date)
+        midnight_utc = datetime.datetime(date.year, date.month, date.day, tzinfo=utc)
+        sunrise = (midnight_utc + datetime.timedelta(minutes=float(rise_min))).astimezone(tzinfo)
+        sunset = (midnight_utc + datetime.timedelta(minutes=float(set_min))).astimezone(tzinfo)
+        days.append({
+            "date": date.isoformat(),
+            "sunrise": sunrise.isoformat(),
+            "sunset": sunset.isoformat(),
+            "sunrise_time": sunrise.strftime("%I:%M %p"),
+            "sunset_time": sunset.strftime("%I:%M %p"),
+            "duration_hours": round(float(set_min - rise_min) / 60.0, 2),
+        })
+
+    return {
+        "location": {
+            "name": location_name,
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone": timezone_str
+        },
+        "days": days,
+    }
+
+
+def format_range_output(data: Dict[str, Any], output_format: str) -> str:
+    """
+    Format the per-day rows from get_sunlight_data_range.
+    """
+    if output_format == "json":
+        return _dumps_indented(data)
+
+    days = data["days"]
+    if output_format == "brief":
+        return "\n".join(f"{day['date']} {day['duration_hours']}" for day in days)
+
+    # default and verbose: one aligned line per day
+    location_name = data["location"]["name"]
+    lines = [f"Sunlight in {location_name} from {days[0]['date']} to {days[-1]['date']}:"]
+    for day in days:
+        lines.append(
+            f"  {day['date']}: {day['duration_hours']:5.2f} hours "
+            f"({day['sunrise_time']} to {day['sunset_time']})"
+        )
+    return "\n".join(lines)
+
+
+def format_output(data: Dict[str, Any], output_format: str,
+                  today: Optional[datetime.date] = None,
+                  date_obj: Optional[datetime.date] = None) -> str:
     """
     Format the sunlight data according to the specified output format.
+    Callers that still hold the original date object can pass it as
+    date_obj to skip re-parsing the ISO string in data["date"].
     """
-    date = datetime.date.fromisoformat(data["date"])
+    # Brief and JSON need no date formatting at all
+    if output_format == "brief":
+        return f"{data['sunlight']['duration_hours']}"
+    if output_format == "json":
+        return _dumps_indented(data)
+
+    if today is None:
+        today = datetime.date.today()
+    date = date_obj if date_obj is not None else datetime.date.fromisoformat(data["date"])
     date_str = date.strftime("%A, %B %d, %Y")
     location_name = data["location"]["name"]
     hours = data["sunlight"]["duration_hours"]
@@ -231,12 +690,8 @@ def format_output(data: Dict[str, Any], output_format: str) -> str:
     lat = data["location"]["latitude"]
     lon = data["location"]["longitude"]
     timezone = data["location"]["timezone"]
-    
-    if output_format == "json":
-        return json.dumps(data, indent=2)
-    elif output_format == "brief":
-        return f"{hours}"
-    elif output_format == "verbose":
+
+    if output_format == "verbose":
         # Add more astronomical information in verbose mode
         result = (
             f"Sunlight information for {date_str} at {location_name}:\n"
@@ -245,30 +700,72 @@ def format_output(data: Dict[str, Any], output_format: str) -> str:
             f"  Daylight duration: {hours} hours\n"
             f"  Lat/Lon:  {lat}, {lon}\n"
             f"  Timezone: {timezone}\n"
-            f"\nAstronomical information:\n"
-            f"  Dawn: {data['astronomical']['dawn']}\n"
-            f"  Noon: {data['astronomical']['noon']}\n"
-            f"  Dusk: {data['astronomical']['dusk']}\n"
         )
+        if "astronomical" in data:
+            result += (
+                f"\nAstronomical information:\n"
+                f"  Dawn: {data['astronomical']['dawn']}\n"
+                f"  Noon: {data['astronomical']['noon']}\n"
+                f"  Dusk: {data['astronomical']['dusk']}\n"
+            )
         return result
     else:  # default
-        day_type = "Today's" if date == datetime.date.today() else f"{date_str}'s"
+        day_type = "Today's" if date == today else f"{date_str}'s"
         return f"{day_type} sunlight in {location_name}: {hours} hours ({sunrise} to {sunset})"
 
 
+def _parse_home_location(value: str) -> Tuple[str, float, float, str]:
+    """
+    Parse the DAYLIGHT_HOME environment variable, formatted as
+    "lat,lon,timezone,name". Lets regulars skip the IP geolocation
+    round-trip entirely on the default no-arguments invocation.
+    """
+    parts = value.split(",", 3)
+    if len(parts) != 4:
+        raise ValueError(
+            'DAYLIGHT_HOME must be formatted as "lat,lon,timezone,name"'
+        )
+    try:
+        latitude = float(parts[0])
+        longitude = float(parts[1])
+    except ValueError:
+        raise ValueError(
+            'DAYLIGHT_HOME must be formatted as "lat,lon,timezone,name"'
+        )
+    timezone_str = parts[2].strip()
+    location_name = parts[3].strip()
+    return location_name, latitude, longitude, timezone_str
+
+
+def _date_arg(date_str: str) -> datetime.date:
+    """
+    argparse type= callback for --date: accepts YYYY-MM-DD or the
+    keywords today/tomorrow/yesterday/day-after, so validation happens
+    at the CLI boundary and main receives a ready date object.
+    """
+    try:
+        return get_date_from_string(date_str)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def parse_args():
     """
     Parse command line arguments.
     """
     parser = argparse.ArgumentParser(
-        description="Get sunlight hours for a given date and location."
+        description="Get sunlight hours for a given date and location.",
+        epilog='Set DAYLIGHT_HOME="lat,lon,timezone,name" to use a fixed '
+               'default location instead of IP geolocation.'
     )
     
     # Date options
     date_group = parser.add_mutually_exclusive_group()
     date_group.add_argument(
-        "--date", "-d", 
-        help="Specific date in YYYY-MM-DD format"
+        "--date", "-d",
+        type=_date_arg,
+        help="Specific date in YYYY-MM-DD format or a keyword "
+             "(today, tomorrow, yesterday, day-after)"
     )
     date_group.add_argument(
         "--today", 
@@ -286,10 +783,16 @@ def parse_args():
         help="Use yesterday's date"
     )
     date_group.add_argument(
-        "--day-after", 
-        action="store_true", 
+        "--day-after",
+        action="store_true",
         help="Use the day after tomorrow"
     )
+    date_group.add_argument(
+        "--range",
+        nargs=2,
+        metavar=("START", "END"),
+        help="Inclusive date range, each bound in YYYY-MM-DD format or a keyword"
+    )
     
     # Location options
     location_group = parser.add_mutually_exclusive_group()
@@ -338,21 +841,38 @@ def main():
     Main function for the daylight CLI.
     """
     args = parse_args()
-    
-    # Determine the date
-    if args.today:
-        date = get_date_from_string("today")
+
+    # Resolve today's date once and reuse it everywhere below
+    today = datetime.date.today()
+
+    # Determine the date (or date range)
+    date_range = None
+    if args.range:
+        try:
+            date_range = (get_date_from_string(args.range[0], today=today),
+                          get_date_from_string(args.range[1], today=today))
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        date = date_range[0]
+    elif args.today:
+        date = today
     elif args.tomorrow:
-        date = get_date_from_string("tomorrow")
+        date = today + datetime.timedelta(days=1)
     elif args.yesterday:
-        date = get_date_from_string("yesterday")
+        date = today - datetime.timedelta(days=1)
     elif args.day_after:
-        date = get_date_from_string("day-after")
+        date = today + datetime.timedelta(days=2)
     elif args.date:
-        date = get_date_from_string(args.date)
+        date = args.date  # already parsed and validated by argparse
     else:
-        date = get_date_from_string("today")  # Default to today
+        date = today  # Default to today
     
+    # A configured home location makes the default branch fully offline
+    home = None
+    if not (args.location or args.zipcode or args.latitude is not None):
+        home = os.environ.get("DAYLIGHT_HOME")
+
     # Determine the location
     try:
         if args.location:
@@ -362,14 +882,13 @@ def main():
         elif args.latitude is not None and args.longitude is not None:
             latitude = args.latitude
             longitude = args.longitude
-            
+
             # Get timezone from coordinates
-            tf = TimezoneFinder()
-            timezone_str = tf.timezone_at(lat=latitude, lng=longitude)
-            if not timezone_str:
-                timezone_str = "UTC"
-                
+            timezone_str = _tz_for(latitude, longitude)
+
             location_name = f"Custom Location ({latitude}, {longitude})"
+        elif home:
+            location_name, latitude, longitude, timezone_str = _parse_home_location(home)
         else:
             # Default to IP-based location
             location_name, latitude, longitude, timezone_str = get_location_from_ip()
@@ -377,14 +896,6 @@ def main():
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
     
-    # Get sunlight data
-    try:
-        data = get_sunlight_data(date, latitude, longitude, timezone_str, location_name)
-        data["location"]["name"] = location_name
-    except Exception as e:
-        print(f"Error calculating sunlight data: {e}", file=sys.stderr)
-        sys.exit(1)
-    
     # Determine output format
     if args.json:
         output_format = "json"
@@ -394,9 +905,32 @@ def main():
         output_format = "verbose"
     else:
         output_format = "default"
-    
+
+    # Range mode computes every date in one vectorized pass
+    if date_range is not None:
+        try:
+            data = get_sunlight_data_range(
+                date_range[0], date_range[1],
+                latitude, longitude, timezone_str, location_name
+            )
+        except Exception as e:
+            print(f"Error calculating sunlight data: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(format_range_output(data, output_format))
+        return
+
+    # Get sunlight data; default/brief output only needs sunrise and sunset
+    try:
+        data = get_sunlight_data(
+            date, latitude, longitude, timezone_str, location_name,
+            need_astronomical=output_format in ("json", "verbose")
+        )
+    except Exception as e:
+        print(f"Error calculating sunlight data: {e}", file=sys.stderr)
+        sys.exit(1)
+
     # Print the formatted output
-    print(format_output(data, output_format))
+    print(format_output(data, output_format, today=today, date_obj=date))
 
 
 if __name__ == "__main__":
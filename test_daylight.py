@@ -235,5 +235,150 @@ class TestDaylightCLI(unittest.TestCase):
             # Due to various calculation methods, just check it's less than 4 hours
             self.assertLess(hours, 4)
 
+class TestHomeLocation(unittest.TestCase):
+    """Test cases for DAYLIGHT_HOME parsing."""
+
+    def test_happy_path(self):
+        """Test a well-formed DAYLIGHT_HOME value."""
+        result = daylight._parse_home_location(
+            "37.3861,-122.0839,America/Los_Angeles,Mountain View, CA"
+        )
+        self.assertEqual(
+            result, ("Mountain View, CA", 37.3861, -122.0839, "America/Los_Angeles")
+        )
+
+    def test_wrong_field_count(self):
+        """Test that too few fields are rejected with the format message."""
+        with self.assertRaises(ValueError) as ctx:
+            daylight._parse_home_location("37.3861,-122.0839,America/Los_Angeles")
+        self.assertIn('"lat,lon,timezone,name"', str(ctx.exception))
+
+    def test_non_numeric_coordinates(self):
+        """Test that non-numeric lat/lon get the format message, not a float error."""
+        for value in ("abc,-122.0839,America/Los_Angeles,Home",
+                      "37.3861,xyz,America/Los_Angeles,Home"):
+            with self.assertRaises(ValueError) as ctx:
+                daylight._parse_home_location(value)
+            self.assertIn('"lat,lon,timezone,name"', str(ctx.exception))
+
+
+class TestNoaaSunriseSunset(unittest.TestCase):
+    """Test cases for the NOAA closed-form solver used on the default path."""
+
+    def test_known_values(self):
+        """Test the NOAA solver against known solstice values."""
+        sunrise, sunset = daylight._sunrise_sunset_noaa(
+            datetime.date(2025, 6, 21), 37.3861, -122.0839, "America/Los_Angeles"
+        )
+        hours = (sunset - sunrise).total_seconds() / 3600
+        self.assertAlmostEqual(hours, 14.74, delta=0.05)
+        self.assertEqual(sunrise.date(), datetime.date(2025, 6, 21))
+        # Sunrise just before 6 AM local, sunset after 8 PM
+        self.assertEqual(sunrise.hour, 5)
+        self.assertEqual(sunset.hour, 20)
+
+    def test_polar_night_clamps_to_zero(self):
+        """Test that polar night yields zero daylight instead of raising."""
+        sunrise, sunset = daylight._sunrise_sunset_noaa(
+            datetime.date(2025, 12, 21), 78.2232, 15.6267, "Arctic/Longyearbyen"
+        )
+        self.assertEqual(sunrise, sunset)
+
+    def test_midnight_sun_clamps_to_full_day(self):
+        """Test that midnight sun yields a full 24 hours instead of raising."""
+        sunrise, sunset = daylight._sunrise_sunset_noaa(
+            datetime.date(2025, 6, 21), 78.2232, 15.6267, "Arctic/Longyearbyen"
+        )
+        hours = (sunset - sunrise).total_seconds() / 3600
+        self.assertAlmostEqual(hours, 24.0, delta=0.05)
+
+    def test_agrees_with_astral(self):
+        """Test that the NOAA solver stays within ~1 minute of astral."""
+        from astral import Observer
+        import astral.sun
+        from zoneinfo import ZoneInfo
+
+        cases = [
+            (datetime.date(2025, 6, 21), 37.3861, -122.0839, "America/Los_Angeles"),
+            (datetime.date(2025, 12, 21), 51.5074, -0.1278, "Europe/London"),
+            (datetime.date(2025, 3, 20), -33.8688, 151.2093, "Australia/Sydney"),
+        ]
+        for date, lat, lon, tz in cases:
+            noaa_rise, noaa_set = daylight._sunrise_sunset_noaa(date, lat, lon, tz)
+            observer = Observer(latitude=lat, longitude=lon)
+            astral_rise = astral.sun.sunrise(observer, date=date, tzinfo=ZoneInfo(tz))
+            astral_set = astral.sun.sunset(observer, date=date, tzinfo=ZoneInfo(tz))
+            self.assertLess(abs((noaa_rise - astral_rise).total_seconds()), 120)
+            self.assertLess(abs((noaa_set - astral_set).total_seconds()), 120)
+
+
+class TestRangeMode(unittest.TestCase):
+    """Test cases for the --range mode (offline, no network needed)."""
+
+    def test_known_values(self):
+        """Test sunrise/sunset over a known range at a known location."""
+        data = daylight.get_sunlight_data_range(
+            datetime.date(2025, 6, 20), datetime.date(2025, 6, 22),
+            37.3861, -122.0839, "America/Los_Angeles", "Mountain View, CA"
+        )
+        self.assertEqual(data["location"]["name"], "Mountain View, CA")
+        self.assertEqual(len(data["days"]), 3)
+
+        # Around the June solstice Mountain View gets ~14.74 hours
+        for day in data["days"]:
+            self.assertAlmostEqual(day["duration_hours"], 14.74, delta=0.05)
+
+        first = data["days"][0]
+        self.assertEqual(first["date"], "2025-06-20")
+        self.assertTrue(first["sunrise"].startswith("2025-06-20T05:4"))
+        self.assertTrue(first["sunset"].startswith("2025-06-20T20:3"))
+        self.assertRegex(first["sunrise_time"], r'^\d{2}:\d{2} [AP]M$')
+        self.assertRegex(first["sunset_time"], r'^\d{2}:\d{2} [AP]M$')
+
+    def test_single_day_range_is_inclusive(self):
+        """Test that a range with equal bounds yields exactly one day."""
+        data = daylight.get_sunlight_data_range(
+            datetime.date(2025, 3, 20), datetime.date(2025, 3, 20),
+            51.5074, -0.1278, "Europe/London", "London"
+        )
+        self.assertEqual(len(data["days"]), 1)
+        self.assertEqual(data["days"][0]["date"], "2025-03-20")
+        # Equinox: close to 12 hours of daylight
+        self.assertAlmostEqual(data["days"][0]["duration_hours"], 12.1, delta=0.3)
+
+    def test_reversed_range_raises(self):
+        """Test that an end date before the start date is rejected."""
+        with self.assertRaises(ValueError):
+            daylight.get_sunlight_data_range(
+                datetime.date(2025, 6, 22), datetime.date(2025, 6, 20),
+                37.3861, -122.0839, "America/Los_Angeles"
+            )
+
+    def test_brief_range_format(self):
+        """Test brief output format for a range."""
+        data = daylight.get_sunlight_data_range(
+            datetime.date(2025, 6, 20), datetime.date(2025, 6, 21),
+            37.3861, -122.0839, "America/Los_Angeles", "Mountain View, CA"
+        )
+        output = daylight.format_range_output(data, "brief")
+        lines = output.split("\n")
+        self.assertEqual(len(lines), 2)
+        for line in lines:
+            self.assertRegex(line, r'^\d{4}-\d{2}-\d{2} \d+\.\d+$')
+
+    def test_json_range_format(self):
+        """Test JSON output format for a range."""
+        data = daylight.get_sunlight_data_range(
+            datetime.date(2025, 6, 20), datetime.date(2025, 6, 21),
+            37.3861, -122.0839, "America/Los_Angeles", "Mountain View, CA"
+        )
+        parsed = json.loads(daylight.format_range_output(data, "json"))
+        self.assertIn("location", parsed)
+        self.assertIn("days", parsed)
+        self.assertEqual(len(parsed["days"]), 2)
+        for key in ["date", "sunrise", "sunset", "sunrise_time", "sunset_time", "duration_hours"]:
+            self.assertIn(key, parsed["days"][0])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file